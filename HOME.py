@@ -8,6 +8,8 @@ import base64
 import os
 from openai import OpenAI
 
+from model_store import load_model
+
 # ---------------- 1. CONFIG & SESSION STATE ----------------
 st.set_page_config(page_title="PlacementIQ Pro2", layout="wide", page_icon="🚀")
 
@@ -187,6 +189,16 @@ if st.button("Analyze Profile Readiness", use_container_width=True):
         probability = (cgpa * 4) + (intern_val * 15) + (len(resume_skills) * 5) + (projects * 4) + (dsa_score * 0.5)
         probability = round(max(5, min(probability, 98)), 1)
 
+        # 3. Trained model estimate (picks up retrained models without a restart)
+        try:
+            model_input = pd.DataFrame([{
+                "cgpa": cgpa, "internship": intern_val, "communication": communication,
+                "skill_match": len(resume_skills) / len(SKILLS_DB) * 100,
+            }])
+            model_probability = round(load_model().predict_proba(model_input)[0][1] * 100, 1)
+        except Exception:
+            model_probability = None
+
         # ---------------- DISPLAY RESULTS ----------------
         st.divider()
         st.markdown(f"""
@@ -201,8 +213,10 @@ if st.button("Analyze Profile Readiness", use_container_width=True):
         with colA: st.metric("Resume Quality", f"{resume_quality}/10")
         with colB: st.metric("Skills Detected", len(resume_skills))
         with colC: st.metric("Project Count", projects)
+        if model_probability is not None:
+            st.caption(f"📈 Placement model estimate (trained on past campus outcomes): {model_probability}%")
         
-        # 3. Strength & Weakness Breakdown
+        # 4. Strength & Weakness Breakdown
         st.subheader("🧐 Why this score?")
         reasons = []
         if cgpa >= 8: reasons.append(f"✅ Strong Academic Performance (+{round(cgpa*1.2,1)}%)")
@@ -213,7 +227,7 @@ if st.button("Analyze Profile Readiness", use_container_width=True):
         for r in reasons:
             st.write(r)
 
-        # 4. Visual Charts
+        # 5. Visual Charts
         res_col_left, res_col_right = st.columns(2)
         with res_col_left:
             st.write("**Competency Levels**")
@@ -231,7 +245,7 @@ if st.button("Analyze Profile Readiness", use_container_width=True):
                 st.write(f"**{comp}:** {c_score}% Match")
                 st.progress(c_score / 100)
 
-        # 5. Exact Next Steps
+        # 6. Exact Next Steps
         st.subheader("🎯 Action Plan")
         if dsa_score < 7: st.info("• Practice 2 LeetCode Medium problems daily.")
         if intern_val == 0: st.info("• Focus on building 1 major Full-Stack project for your portfolio.")
@@ -0,0 +1,52 @@
+import os
+
+import pandas as pd
+
+from storage import BASE_DIR, atomic_write
+
+# Typed columnar copy of campus.csv. The CSV stays the editable source; the
+# Parquet file is rebuilt from it whenever the CSV is newer and is what
+# training, retraining and lookups read. Categoricals and float32 scores cut
+# memory several-fold versus the default object/float64 parse, and Parquet
+# lets callers load only the columns and rows they need.
+#
+#   load_campus(columns=["degree_p", "status"])
+#   load_campus(filters=[("specialisation", "==", "Mkt&Fin"), ("workex", "==", "Yes")])
+
+CAMPUS_CSV = os.path.join(BASE_DIR, "campus.csv")
+CAMPUS_PARQUET = os.path.join(BASE_DIR, "campus.parquet")
+
+CATEGORICAL_COLUMNS = ["gender", "ssc_b", "hsc_b", "hsc_s", "degree_t", "workex", "specialisation", "status"]
+SCORE_COLUMNS = ["ssc_p", "hsc_p", "degree_p", "etest_p", "mba_p"]
+
+CAMPUS_DTYPES = {
+    "sl_no": "int32",
+    **{c: "category" for c in CATEGORICAL_COLUMNS},
+    **{c: "float32" for c in SCORE_COLUMNS},
+    # Unplaced students have no salary, so this has to stay a float for NaN
+    "salary": "float32",
+}
+
+
+def read_campus_csv(path=CAMPUS_CSV):
+    """Parse a campus-format CSV straight into the compact dtypes."""
+    return pd.read_csv(path, dtype=CAMPUS_DTYPES)
+
+
+def convert_campus(csv_path=CAMPUS_CSV, parquet_path=CAMPUS_PARQUET):
+    """Write the typed Parquet copy of the CSV and return its path."""
+    df = read_campus_csv(csv_path)
+    return atomic_write(parquet_path, lambda tmp_path: df.to_parquet(tmp_path, index=False))
+
+
+def load_campus(columns=None, filters=None, csv_path=CAMPUS_CSV, parquet_path=CAMPUS_PARQUET):
+    """Load campus data, reading only `columns` and rows matching `filters`.
+
+    `filters` uses pyarrow's form, e.g. [("status", "==", "Placed")], and is
+    pushed down to the Parquet reader so skipped row groups are never decoded.
+    """
+    if not os.path.exists(parquet_path) or (
+        os.path.exists(csv_path) and os.path.getmtime(csv_path) > os.path.getmtime(parquet_path)
+    ):
+        convert_campus(csv_path, parquet_path)
+    return pd.read_parquet(parquet_path, columns=columns, filters=filters, memory_map=True)
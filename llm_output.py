@@ -0,0 +1,390 @@
+import json
+import re
+
+# ---------------- 1. SCHEMAS ----------------
+# Each schema maps a field name to the python type json.loads must give us.
+MCQ_QUESTION_SCHEMA = {
+    "question": str,
+    "options": list,
+    "correct_answer": str,
+    "explanation": str,
+}
+MCQ_OPTION_COUNT = 4
+
+VERIFICATION_SCHEMA = {
+    "proven_skill": str,
+    "mentioned_in_resume": bool,
+    "improvement": str,
+}
+
+MCQ_FORMAT_EXAMPLE = """{
+    "questions": [
+        {
+            "question": "Question text here",
+            "options": ["Option A", "Option B", "Option C", "Option D"],
+            "correct_answer": "Option A",
+            "explanation": "Explanation of why this is correct."
+        }
+    ]
+}"""
+
+VERIFICATION_FORMAT_EXAMPLE = """{
+    "proven_skill": "What skill/project the certificate proves",
+    "mentioned_in_resume": true,
+    "improvement": "How the resume can be improved based on this certificate"
+}"""
+
+
+# ---------------- 2. LOCAL REPAIR ----------------
+FENCE_RE = re.compile(r"```(?:json|JSON)?\s*(.*?)(?:```|$)", re.DOTALL)
+PY_LITERALS = {"True": "true", "False": "false", "None": "null"}
+# String delimiters LLMs use, mapped to the characters that may close them.
+QUOTE_CLOSERS = {'"': '"', "“": '”"', "'": "'", "‘": "’'"}
+# Single-quote closers double as apostrophes, so they only end a string when
+# JSON punctuation follows ('It's' stays one string).
+APOSTROPHE_QUOTES = "'‘"
+
+
+def _closes_string(text, i, opener):
+    """Whether text[i] ends a string opened by `opener`; None if more text is needed."""
+    if text[i] not in QUOTE_CLOSERS[opener]:
+        return False
+    if opener not in APOSTROPHE_QUOTES:
+        return True
+    rest = text[i + 1:].lstrip()
+    if not rest:
+        return None
+    return rest[0] in ",:}]"
+
+
+def _value_end(text):
+    """Index just past the first top-level value in `text`, or None if it never closes."""
+    depth, quote, escape = 0, None, False
+    for i, ch in enumerate(text):
+        if quote:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif _closes_string(text, i, quote) is not False:
+                quote = None
+        elif ch in QUOTE_CLOSERS:
+            quote = ch
+        elif ch in "{[":
+            depth += 1
+        elif ch in "}]":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return None
+
+
+def _payload_start(text, i):
+    """Whether the bracket at text[i] can open a payload; None if more text is needed.
+
+    Payloads are objects or arrays of objects, so brackets in chatter before
+    the JSON ("Here are [3] questions") are not mistaken for it.
+    """
+    rest = text[i + 1:].lstrip()
+    if not rest:
+        return None
+    if text[i] == "{":
+        return rest[0] in QUOTE_CLOSERS or rest[0] == "}"
+    return rest[0] == "{"
+
+
+def strip_wrapping(text):
+    """Drop markdown fences and any chatter around the first JSON value."""
+    text = text.strip()
+    fenced = FENCE_RE.search(text)
+    if fenced:
+        text = fenced.group(1).strip()
+    start = next((i for i, ch in enumerate(text) if ch in "{[" and _payload_start(text, i) is not False), None)
+    if start is None:
+        return text
+    text = text[start:]
+    # A truncated reply never closes; repair_json closes it.
+    end = _value_end(text)
+    return text[:end] if end is not None else text
+
+
+def repair_json(text):
+    """Fix the defects LLMs usually produce, without another round-trip.
+
+    Handles code fences, surrounding chatter, single and curly quoted strings,
+    trailing commas, python literals, raw newlines inside strings and replies
+    truncated mid-object.
+    """
+    text = strip_wrapping(text)
+
+    out = []
+    stack = []
+    quote, escape = None, False
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if quote:
+            if escape:
+                escape = False
+                # \' is valid in python/JS strings but not in JSON
+                if ch == "'":
+                    out.pop()
+            elif ch == "\\":
+                escape = True
+            elif _closes_string(text, i, quote) is not False:
+                quote = None
+                ch = '"'
+            elif ch == '"':
+                ch = '\\"'
+            elif ch == "\n":
+                ch = "\\n"
+            elif ch == "\t":
+                ch = "\\t"
+            out.append(ch)
+            i += 1
+            continue
+
+        if ch in QUOTE_CLOSERS:
+            quote = ch
+            ch = '"'
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+        elif ch in "}]":
+            _drop_trailing_comma(out)
+            if stack:
+                stack.pop()
+        elif ch.isalpha():
+            word = re.match(r"\w+", text[i:]).group(0)
+            out.append(PY_LITERALS.get(word, word))
+            i += len(word)
+            continue
+        out.append(ch)
+        i += 1
+
+    # Truncated reply: close the open string and every open bracket.
+    if quote:
+        if escape:
+            out.pop()
+        out.append('"')
+    while stack:
+        _drop_trailing_comma(out)
+        if out and out[-1].rstrip().endswith(":"):
+            out.append("null")
+        out.append(stack.pop())
+    return "".join(out)
+
+
+def _drop_trailing_comma(out):
+    j = len(out) - 1
+    while j >= 0 and out[j].isspace():
+        j -= 1
+    if j >= 0 and out[j] == ",":
+        del out[j]
+
+
+def parse_json(text):
+    """json.loads with a local repair pass before giving up."""
+    try:
+        return json.loads(text)
+    except (json.JSONDecodeError, TypeError):
+        pass
+    try:
+        return json.loads(repair_json(text or ""))
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Unrecoverable JSON from model: {e}") from e
+
+
+# ---------------- 3. VALIDATION ----------------
+def _check_schema(item, schema):
+    if not isinstance(item, dict):
+        return [f"expected an object, got {type(item).__name__}"]
+    errors = []
+    for field, kind in schema.items():
+        if field not in item:
+            errors.append(f"missing '{field}'")
+        elif not isinstance(item[field], kind):
+            errors.append(f"'{field}' should be {kind.__name__}")
+    return errors
+
+
+def _match_answer(answer, options):
+    """Map a loosely written answer ('B', 'Option B', 'b) Queue') onto an option.
+
+    Anything ambiguous returns None so the question is re-asked rather than
+    graded against a guessed key.
+    """
+    norm = lambda s: re.sub(r"\s+", " ", str(s)).strip().lower()
+    for opt in options:
+        if norm(opt) == norm(answer):
+            return opt
+    letter = re.fullmatch(r"(?:option\s*)?([a-d])(?:[).:](?:\s(.*))?)?", norm(answer))
+    if letter:
+        idx = "abcd".index(letter.group(1))
+        if idx >= len(options):
+            return None
+        # "b) Heap" must name options[1] too, otherwise letter and text disagree
+        if letter.group(2) and letter.group(2).strip() != norm(options[idx]):
+            return None
+        return options[idx]
+    # The answer quotes exactly one option verbatim, e.g. "Queue (FIFO)"
+    quoted = [opt for opt in options if re.search(rf"(?<!\w){re.escape(norm(opt))}(?!\w)", norm(answer))]
+    return quoted[0] if len(quoted) == 1 else None
+
+
+def validate_question(item):
+    """Return (question, errors). The question is normalised when fixable."""
+    if isinstance(item, dict):
+        item = dict(item)
+        if isinstance(item.get("options"), dict):
+            item["options"] = list(item["options"].values())
+        if isinstance(item.get("options"), list):
+            item["options"] = [str(o).strip() for o in item["options"]]
+        item.setdefault("explanation", "")
+    errors = _check_schema(item, MCQ_QUESTION_SCHEMA)
+    if errors:
+        return item, errors
+
+    options = item["options"]
+    if len(options) != MCQ_OPTION_COUNT or len(set(options)) != len(options):
+        errors.append(f"need {MCQ_OPTION_COUNT} distinct options")
+    if not item["question"].strip():
+        errors.append("empty question")
+    answer = _match_answer(item["correct_answer"], options)
+    if answer is None:
+        errors.append("correct_answer is not one of the options")
+    else:
+        item["correct_answer"] = answer
+    return item, errors
+
+
+def validate_verification(payload):
+    """Return (payload, errors) for a certificate verification reply."""
+    if isinstance(payload, dict) and isinstance(payload.get("mentioned_in_resume"), str):
+        payload = dict(payload)
+        payload["mentioned_in_resume"] = payload["mentioned_in_resume"].strip().lower() in ("yes", "true")
+    return payload, _check_schema(payload, VERIFICATION_SCHEMA)
+
+
+def parse_mcq_payload(text):
+    """Parse a full MCQ reply into (valid_questions, invalid_items)."""
+    data = parse_json(text)
+    items = data
+    if isinstance(data, dict):
+        # A lone question object instead of the {"questions": [...]} wrapper
+        items = data["questions"] if "questions" in data else [data] if "question" in data else []
+    if not isinstance(items, list):
+        raise ValueError("Model reply has no 'questions' list.")
+    valid, invalid = [], []
+    for item in items:
+        question, errors = validate_question(item)
+        if errors:
+            invalid.append((question, errors))
+        else:
+            valid.append(question)
+    return valid, invalid
+
+
+# ---------------- 4. STREAMING PARSER ----------------
+class MCQStream:
+    """Incrementally pulls finished question objects out of a streamed reply.
+
+    Feed it text deltas as they arrive; every question object that closes is
+    parsed, repaired and validated straight away so the page can render it
+    before the rest of the reply has been generated.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.valid = []
+        self.invalid = []
+        self._pos = 0
+        self._stack = []
+        self._quote = None
+        self._escape = False
+        self._item_start = None
+        self._closed = False
+
+    def feed(self, chunk):
+        """Consume a text delta, return the questions that became valid."""
+        self.buffer += chunk or ""
+        fresh = []
+        while self._pos < len(self.buffer) and not self._closed:
+            i, ch = self._pos, self.buffer[self._pos]
+            if self._quote:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                else:
+                    closes = _closes_string(self.buffer, i, self._quote)
+                    if closes is None:
+                        break  # can't tell an apostrophe from a closing quote yet
+                    if closes:
+                        self._quote = None
+                self._pos += 1
+                continue
+            if ch in "{[" and not self._stack:
+                starts = _payload_start(self.buffer, i)
+                if starts is None:
+                    break  # wait to see what follows the bracket
+                if not starts:
+                    self._pos += 1
+                    continue
+            self._pos += 1
+            # Quotes in chatter before the JSON ("Here's your test") are not strings
+            if ch in QUOTE_CLOSERS and self._stack:
+                self._quote = ch
+            elif ch in "{[":
+                # Question objects are elements of an array: either the root
+                # array or the "questions" array inside the root object.
+                if ch == "{" and self._stack in (["["], ["{", "["]):
+                    self._item_start = i
+                self._stack.append(ch)
+            elif ch in "}]" and self._stack:
+                self._stack.pop()
+                # Anything after the root value is chatter
+                self._closed = not self._stack
+                if ch == "}" and self._item_start is not None and self._stack in (["["], ["{", "["]):
+                    raw = self.buffer[self._item_start:i + 1]
+                    self._item_start = None
+                    question = self._accept(raw)
+                    if question is not None:
+                        fresh.append(question)
+        return fresh
+
+    def _accept(self, raw):
+        try:
+            item = parse_json(raw)
+        except ValueError as e:
+            self.invalid.append((raw, [str(e)]))
+            return None
+        question, errors = validate_question(item)
+        if errors:
+            self.invalid.append((question, errors))
+            return None
+        self.valid.append(question)
+        return question
+
+    def finish(self):
+        """Fall back to a whole-reply parse when nothing streamed out cleanly."""
+        if not self.valid and not self.invalid and self.buffer.strip():
+            self.valid, self.invalid = parse_mcq_payload(self.buffer)
+        return self.valid, self.invalid
+
+
+# ---------------- 5. TARGETED RE-ASK ----------------
+def build_reask_prompt(count, invalid, context):
+    """Prompt for `count` replacement questions only, citing what went wrong."""
+    problems = "\n".join(
+        f"- {json.dumps(item)[:300]} -> {'; '.join(errors)}" for item, errors in invalid
+    ) or "- (reply was cut short)"
+    return f"""
+    {context}
+    Some questions you generated were unusable:
+    {problems}
+
+    Generate exactly {count} NEW replacement question(s). Each needs exactly {MCQ_OPTION_COUNT} distinct
+    options and a "correct_answer" copied verbatim from the options.
+    Reply strictly with a valid JSON object in this exact format, with no markdown or other text:
+    {MCQ_FORMAT_EXAMPLE}
+    """
@@ -0,0 +1,32 @@
+import os
+import threading
+
+import joblib
+
+from storage import BASE_DIR, atomic_write
+
+# Serving side of the placement model: pages call load_model() on every run and
+# get the in-memory copy until retrain.py swaps a new file in.
+MODEL_PATH = os.path.join(BASE_DIR, "placement_model.pkl")
+
+_lock = threading.Lock()
+_cache = {}
+
+
+def save_model(model, path=None):
+    """Swap the model file in atomically so serving never loads a partial pickle."""
+    atomic_write(path or MODEL_PATH, lambda tmp_path: joblib.dump(model, tmp_path))
+
+
+def load_model(path=None):
+    """Return the current model, reloading only when the file was swapped."""
+    path = path or MODEL_PATH
+    stat = os.stat(path)
+    version = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        cached = _cache.get(path)
+        if cached and cached[0] == version:
+            return cached[1]
+        model = joblib.load(path)
+        _cache[path] = (version, model)
+        return model
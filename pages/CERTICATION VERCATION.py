@@ -2,6 +2,8 @@ import streamlit as st
 import pdfplumber
 from openai import OpenAI
 
+from llm_output import VERIFICATION_FORMAT_EXAMPLE, parse_json, validate_verification
+
 st.set_page_config(page_title="Certificate Verifier", page_icon="📜")
 st.title("📜 Certificate & Resume Matcher")
 
@@ -29,17 +31,27 @@ if cert_file and st.button("Verify Alignment", type="primary"):
             Certificate Text: {cert_text[:500]}
             Resume Text: {resume_text[:1000]}
             
-            Tell the user strictly in 3 short bullet points:
-            1. What skill/project the certificate proves.
-            2. If that skill is clearly mentioned in their resume.
-            3. How they can improve their resume based on this certificate.
+            Reply strictly with a valid JSON object in this exact format, with no markdown or other text:
+            {VERIFICATION_FORMAT_EXAMPLE}
             """
             
             response = client.chat.completions.create(
                 model="llama-3.3-70b-versatile",
                 messages=[{"role": "user", "content": prompt}]
             )
+            raw_content = response.choices[0].message.content
+            try:
+                result, errors = validate_verification(parse_json(raw_content))
+            except ValueError:
+                result, errors = None, ["unparseable reply"]
+
             st.success("Verification Complete!")
-            st.markdown(response.choices[0].message.content)
+            if errors:
+                # Still show the model's answer rather than failing the whole verification
+                st.markdown(raw_content)
+            else:
+                st.markdown(f"- **Certificate proves:** {result['proven_skill']}")
+                st.markdown(f"- **Mentioned in resume:** {'✅ Yes' if result['mentioned_in_resume'] else '❌ No'}")
+                st.markdown(f"- **How to improve:** {result['improvement']}")
         except Exception as e:
             st.error("Error connecting to AI API. Check your Groq Key in the .env file.")
\ No newline at end of file
@@ -1,7 +1,8 @@
 import streamlit as st
-import json
 from openai import OpenAI
 
+from llm_output import MCQ_FORMAT_EXAMPLE, MCQStream, build_reask_prompt, parse_mcq_payload
+
 st.set_page_config(page_title="AI Mock Test", page_icon="🧠", layout="wide")
 
 # --- AI BOT SIDEBAR ---
@@ -57,47 +58,62 @@ if not user_skills:
 st.info(f"**Target Role:** {target_role} | **Detected Stack:** {', '.join(user_skills)}")
 
 # --- GENERATE TEST BUTTON ---
+NUM_QUESTIONS = 3
+
 if st.button("Generate Custom HackWave Test", type="primary"):
     with st.spinner("AI is compiling your interactive test..."):
         try:
+            context = f"""
+            You are a technical interviewer for the role of {target_role}.
+            The candidate knows: {', '.join(user_skills)}.
+            """
             # We ask the LLM to reply strictly in JSON format
             prompt = f"""
-            You are a technical interviewer for the role of {target_role}. 
-            The candidate knows: {', '.join(user_skills)}.
-            Generate a 3-question Multiple Choice Test to check their knowledge.
-            
+            {context}
+            Generate a {NUM_QUESTIONS}-question Multiple Choice Test to check their knowledge.
+
             You MUST reply strictly with a valid JSON object in this exact format. Do not add markdown blocks like ```json or any other text.
-            {{
-                "questions": [
-                    {{
-                        "question": "Question text here",
-                        "options": ["Option A", "Option B", "Option C", "Option D"],
-                        "correct_answer": "Option A",
-                        "explanation": "Explanation of why this is correct."
-                    }}
-                ]
-            }}
+            {MCQ_FORMAT_EXAMPLE}
             """
-            
-            response = client.chat.completions.create(
+
+            # Stream the reply so each question shows up as soon as it is complete
+            stream = client.chat.completions.create(
                 model="llama-3.3-70b-versatile",
-                messages=[{"role": "user", "content": prompt}]
+                messages=[{"role": "user", "content": prompt}],
+                stream=True,
             )
-            
-            raw_content = response.choices[0].message.content.strip()
-            
-            # Clean up just in case the LLM adds markdown tags
-            if raw_content.startswith("```json"):
-                raw_content = raw_content[7:-3].strip()
-            elif raw_content.startswith("```"):
-                raw_content = raw_content[3:-3].strip()
-
-            # Parse JSON and save to session state
-            test_data = json.loads(raw_content)
-            st.session_state.mcq_test_data = test_data["questions"]
+            parser = MCQStream()
+            preview = st.container()
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                for q in parser.feed(chunk.choices[0].delta.content):
+                    preview.markdown(f"✅ **Q{len(parser.valid)}:** {q['question']}")
+            questions, invalid = parser.finish()
+            questions = questions[:NUM_QUESTIONS]
+
+            # Re-ask only for the questions that were missing or failed validation
+            missing = NUM_QUESTIONS - len(questions)
+            if missing > 0:
+                preview.caption(f"Regenerating {missing} question(s) that came back malformed...")
+                response = client.chat.completions.create(
+                    model="llama-3.3-70b-versatile",
+                    messages=[{"role": "user", "content": build_reask_prompt(missing, invalid, context)}]
+                )
+                try:
+                    extra, _ = parse_mcq_payload(response.choices[0].message.content)
+                    questions += extra[:missing]
+                except ValueError:
+                    # Keep the questions that already streamed in valid
+                    pass
+
+            if not questions:
+                raise ValueError("No valid questions were generated.")
+
+            st.session_state.mcq_test_data = questions
             st.session_state.test_submitted = False # Reset test status
             st.rerun() # Refresh the page to show the test
-            
+
         except Exception as e:
             st.error(f"Failed to generate test. The AI might have returned invalid format. Try again! Error: {e}")
 
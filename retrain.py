@@ -0,0 +1,296 @@
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
+from sklearn.impute import SimpleImputer
+from sklearn.pipeline import Pipeline
+from sklearn.linear_model import LogisticRegression
+from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
+from sklearn.metrics import accuracy_score
+
+from campus_data import load_campus, read_campus_csv
+from model_store import load_model, save_model
+from storage import BASE_DIR, atomic_write
+
+# Incremental retraining: new placement outcomes are appended as Parquet part
+# files with their features already derived, drift is measured against the
+# feature matrix the live model was trained on, and the model is only rebuilt
+# (and hot-swapped) when drift or the amount of new data makes it worthwhile.
+#
+#   python retrain.py --record new_outcomes.csv   # append outcomes, then check
+#   python retrain.py                             # check thresholds, retrain if tripped
+#   python retrain.py --force                     # retrain regardless
+
+# ---------------- 1. PATHS & THRESHOLDS ----------------
+DATA_DIR = os.path.join(BASE_DIR, "data")
+OUTCOMES_DIR = os.path.join(DATA_DIR, "outcomes")
+SNAPSHOT_PATH = os.path.join(DATA_DIR, "train_snapshot.parquet")
+META_PATH = os.path.join(DATA_DIR, "model_meta.json")
+
+FEATURES = ["cgpa", "internship", "communication", "skill_match"]
+TARGET = "placed"
+# Raw campus columns build_features needs, so loads can skip everything else
+SOURCE_COLUMNS = ["ssc_p", "hsc_p", "degree_p", "mba_p", "workex", "etest_p", "status"]
+FEATURE_DTYPES = {**{f: "float32" for f in FEATURES}, TARGET: "int8"}
+# Snapshot column naming the part file (or campus.csv) each row came from
+SOURCE = "source"
+BASE_SOURCE = "campus.csv"
+
+PSI_THRESHOLD = 0.2      # population stability index above this = significant drift
+MIN_DRIFT_ROWS = 50      # too few new rows make PSI meaningless
+NEW_DATA_RATIO = 0.25    # retrain once new outcomes reach 25% of the training rows
+PSI_BINS = 5             # coarse bins keep PSI stable on small batches
+HOLDOUT_SHARE = 0.2      # share of new outcomes kept unseen to compare candidate vs live
+
+
+# ---------------- 2. FEATURES ----------------
+def build_features(df):
+    """Derive model features from campus-format rows.
+
+    skill_match comes from the resume skill matcher and is only present on
+    outcomes recorded from the app; historical rows leave it empty and the
+    model imputes it instead of training on made-up values.
+    """
+    features = pd.DataFrame(index=df.index)
+    features["cgpa"] = df[["ssc_p", "hsc_p", "degree_p", "mba_p"]].mean(axis=1) / 10
+    features["internship"] = (df["workex"] == "Yes").astype(int)
+    features["communication"] = df["etest_p"] / 10
+    features["skill_match"] = df["skill_match"] if "skill_match" in df else np.nan
+    features[TARGET] = (df["status"] == "Placed").astype(int)
+    return features.astype(FEATURE_DTYPES)
+
+
+def candidate_models():
+    impute = lambda: SimpleImputer(strategy="median", keep_empty_features=True)
+    return {
+        "Logistic": Pipeline([
+            ("impute", impute()),
+            ("scaler", StandardScaler()),
+            ("model", LogisticRegression(class_weight="balanced", max_iter=1000))
+        ]),
+        "RandomForest": Pipeline([
+            ("impute", impute()),
+            ("model", RandomForestClassifier(n_estimators=200, random_state=42))
+        ]),
+        "GradientBoost": Pipeline([
+            ("impute", impute()),
+            ("model", GradientBoostingClassifier(random_state=42))
+        ]),
+    }
+
+
+# ---------------- 3. OUTCOME STORE ----------------
+def record_outcomes(df):
+    """Append newly observed outcomes as a new part file, features included."""
+    os.makedirs(OUTCOMES_DIR, exist_ok=True)
+    part = df.drop(columns=[c for c in FEATURES + [TARGET] if c in df]).reset_index(drop=True)
+    part = pd.concat([part, build_features(df).reset_index(drop=True)], axis=1)
+    path = os.path.join(OUTCOMES_DIR, f"part-{time.time_ns()}.parquet")
+    return atomic_write(path, lambda tmp_path: part.to_parquet(tmp_path, index=False))
+
+
+def list_parts():
+    if not os.path.isdir(OUTCOMES_DIR):
+        return []
+    return sorted(f for f in os.listdir(OUTCOMES_DIR) if f.startswith("part-") and f.endswith(".parquet"))
+
+
+def load_new_outcomes(trained):
+    """Feature matrix of every part not yet folded into the live model."""
+    parts = [p for p in list_parts() if p not in trained]
+    frames = [
+        pd.read_parquet(os.path.join(OUTCOMES_DIR, p), columns=FEATURES + [TARGET]).assign(**{SOURCE: p})
+        for p in parts
+    ]
+    if not frames:
+        return parts, pd.DataFrame(columns=FEATURES + [TARGET, SOURCE]).astype(FEATURE_DTYPES)
+    return parts, pd.concat(frames, ignore_index=True)
+
+
+# ---------------- 4. SNAPSHOT & METADATA ----------------
+def load_meta():
+    if not os.path.exists(META_PATH):
+        return {"rejected_parts": []}
+    with open(META_PATH) as f:
+        return json.load(f)
+
+
+def save_meta(meta):
+    def write(tmp_path):
+        with open(tmp_path, "w") as f:
+            json.dump(meta, f, indent=2)
+    atomic_write(META_PATH, write)
+
+
+def load_snapshot():
+    """Cached feature matrix of the live model, bootstrapped from campus.csv.
+
+    The snapshot is also the record of which parts the live model was trained
+    on, via its SOURCE column.
+    """
+    if os.path.exists(SNAPSHOT_PATH):
+        return pd.read_parquet(SNAPSHOT_PATH)
+    return _base_features()
+
+
+def _base_features():
+    return build_features(load_campus(columns=SOURCE_COLUMNS)).assign(**{SOURCE: BASE_SOURCE})
+
+
+def load_training_data():
+    """Every known outcome, campus.csv plus all recorded parts, for a full rebuild."""
+    _, recorded = load_new_outcomes(set())
+    return pd.concat([_base_features(), recorded], ignore_index=True)
+
+
+# ---------------- 5. DRIFT ----------------
+def population_stability(expected, actual, bins=PSI_BINS):
+    """PSI of one feature; discrete features are compared value by value."""
+    expected, actual = expected.dropna(), actual.dropna()
+    if expected.empty or actual.empty:
+        return 0.0
+    if expected.nunique() <= bins:
+        values = sorted(set(expected.unique()) | set(actual.unique()))
+        e = expected.value_counts(normalize=True).reindex(values, fill_value=0).to_numpy()
+        a = actual.value_counts(normalize=True).reindex(values, fill_value=0).to_numpy()
+    else:
+        edges = np.unique(np.quantile(expected, np.linspace(0, 1, bins + 1)))
+        edges[0], edges[-1] = -np.inf, np.inf
+        e = np.histogram(expected, edges)[0] / len(expected)
+        a = np.histogram(actual, edges)[0] / len(actual)
+    e, a = np.clip(e, 1e-4, None), np.clip(a, 1e-4, None)
+    return float(np.sum((a - e) * np.log(a / e)))
+
+
+def drift_report(snapshot, new):
+    return {f: round(population_stability(snapshot[f], new[f]), 4) for f in FEATURES}
+
+
+def should_retrain(snapshot, new):
+    """Return (retrain?, reason, drift report)."""
+    if len(new) >= NEW_DATA_RATIO * len(snapshot):
+        return True, f"{len(new)} new outcomes (>= {NEW_DATA_RATIO:.0%} of {len(snapshot)})", {}
+    if len(new) < MIN_DRIFT_ROWS:
+        return False, f"only {len(new)} new outcomes", {}
+    report = drift_report(snapshot, new)
+    drifted = [f for f, psi in report.items() if psi > PSI_THRESHOLD]
+    if drifted:
+        return True, f"drift in {', '.join(drifted)}", report
+    return False, "no significant drift", report
+
+
+# ---------------- 6. RETRAIN & SWAP ----------------
+def _accuracy(model, data):
+    return accuracy_score(data[TARGET], model.predict(data[FEATURES]))
+
+
+def train_best(snapshot, new):
+    """Return (model, candidate score, holdout) for a retrain.
+
+    Only the new outcomes are unseen by the live model, so a share of them is
+    held out from the candidate as well; the caller scores the live model on
+    the same rows. The winning candidate is then refit on everything. The
+    score is None when there are no new rows to compare on.
+    """
+    holdout = new.sample(frac=HOLDOUT_SHARE, random_state=42)
+    train = pd.concat([snapshot, new.drop(holdout.index)], ignore_index=True)
+    fit_part, val_part = train_test_split(train, test_size=0.2, random_state=42)
+
+    best_name, best_val = None, -1
+    for name, m in candidate_models().items():
+        m.fit(fit_part[FEATURES], fit_part[TARGET])
+        score = _accuracy(m, val_part)
+        print(f"{name} Accuracy:", round(score, 4))
+        if score > best_val:
+            best_name, best_val = name, score
+    print("Best candidate:", best_name)
+
+    score = None
+    if not holdout.empty:
+        candidate = candidate_models()[best_name].fit(train[FEATURES], train[TARGET])
+        score = _accuracy(candidate, holdout)
+
+    data = pd.concat([snapshot, new], ignore_index=True)
+    return candidate_models()[best_name].fit(data[FEATURES], data[TARGET]), score, holdout
+
+
+def retrain(force=False):
+    meta = load_meta()
+    snapshot = load_snapshot()
+    parts, new = load_new_outcomes(set(snapshot[SOURCE].unique()))
+
+    # Parts a rejected candidate was already evaluated on don't trigger another
+    # retrain by themselves; they are still trained on once fresh data arrives.
+    fresh = new[~new[SOURCE].isin(meta.get("rejected_parts", []))]
+    retrain_now, reason, report = should_retrain(snapshot, fresh)
+    if force:
+        retrain_now, reason = True, "forced"
+    print(f"Retrain: {retrain_now} ({reason})")
+    if report:
+        print("Drift (PSI):", report)
+    if not retrain_now:
+        return False
+
+    model, score, holdout = train_best(snapshot, new)
+    live_score, live_error = None, None
+    if not holdout.empty:
+        try:
+            live_score = _accuracy(load_model(), holdout)
+        except FileNotFoundError:
+            pass  # no live model yet, nothing to compare against
+        except Exception as e:
+            # A live model we can't score is not proof the candidate is better
+            live_error = str(e).splitlines()[0] if str(e) else type(e).__name__
+            if not force:
+                print(f"Kept live model: it could not be scored on unseen outcomes ({live_error}). "
+                      "Rerun with --force to replace it.")
+                return False
+            print(f"Replacing live model that could not be scored ({live_error}) because of --force")
+
+    result = {
+        "trained_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "holdout_accuracy": None if score is None else round(score, 4),
+        "live_holdout_accuracy": None if live_score is None else round(live_score, 4),
+        "live_error": live_error,
+        "reason": reason,
+        "drift": report,
+    }
+    os.makedirs(DATA_DIR, exist_ok=True)
+    if live_score is not None and score < live_score:
+        print(f"Kept live model: candidate {round(score, 4)} < live {round(live_score, 4)} on unseen outcomes")
+        meta.update(rejected_parts=parts, last_rejected=result)
+        save_meta(meta)
+        return False
+
+    commit_model(model, pd.concat([snapshot, new], ignore_index=True), result)
+    print("Model swapped in with holdout accuracy:", result["holdout_accuracy"])
+    return True
+
+
+def commit_model(model, data, result):
+    """Make `model`, trained on all of `data`, the live model and record it."""
+    os.makedirs(DATA_DIR, exist_ok=True)
+    save_model(model)
+    # The snapshot is the commit point: if we crash before this, the next run
+    # retrains on the same parts instead of adding them to the snapshot twice.
+    atomic_write(SNAPSHOT_PATH, lambda tmp_path: data.to_parquet(tmp_path, index=False))
+    meta = load_meta()
+    meta.update(result, rejected_parts=[], rows=len(data))
+    save_meta(meta)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Incrementally retrain the placement model.")
+    parser.add_argument("--record", metavar="CSV", help="campus-format CSV of new outcomes to append first")
+    parser.add_argument("--force", action="store_true", help="retrain even if no threshold tripped")
+    args = parser.parse_args()
+
+    if args.record:
+        print("Recorded outcomes to", record_outcomes(read_campus_csv(args.record)))
+    retrain(force=args.force)
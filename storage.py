@@ -0,0 +1,37 @@
+import os
+import tempfile
+
+# Shared file helpers for the data layer, the model store and retraining.
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def atomic_write(path, write):
+    """Call write(tmp_path) on a unique temp file, then rename it over `path`.
+
+    The temp file sits next to the target so os.replace is an atomic rename:
+    readers see the old file or the new one, never a half-written one, and
+    concurrent writers never share a temp file.
+    """
+    base = os.path.basename(path)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f".{base}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp_path)
+        # mkstemp creates 0600 files; keep the target readable by other users
+        # (e.g. a Streamlit process serving the model) as a normal write would
+        os.chmod(tmp_path, _target_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return path
+
+
+def _target_mode(path):
+    """Mode of the file being replaced, or 0644 less the umask for a new one."""
+    try:
+        return os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o644 & ~umask
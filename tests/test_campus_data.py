@@ -0,0 +1,64 @@
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+import campus_data
+
+
+@pytest.fixture
+def paths(tmp_path):
+    csv_path = str(tmp_path / "campus.csv")
+    shutil.copy(campus_data.CAMPUS_CSV, csv_path)
+    return csv_path, str(tmp_path / "campus.parquet")
+
+
+def load(paths, **kwargs):
+    csv_path, parquet_path = paths
+    return campus_data.load_campus(csv_path=csv_path, parquet_path=parquet_path, **kwargs)
+
+
+def test_dtypes_are_compact(paths):
+    df = load(paths)
+    for column in campus_data.CATEGORICAL_COLUMNS:
+        assert isinstance(df[column].dtype, pd.CategoricalDtype), column
+    for column in campus_data.SCORE_COLUMNS + ["salary"]:
+        assert df[column].dtype == "float32", column
+    assert df["sl_no"].dtype == "int32"
+    assert df.memory_usage(deep=True).sum() < pd.read_csv(paths[0]).memory_usage(deep=True).sum() / 2
+
+
+def test_columns_are_pruned(paths):
+    df = load(paths, columns=["degree_p", "status"])
+    assert list(df.columns) == ["degree_p", "status"]
+    assert len(df) == 215
+
+
+def test_filters_are_pushed_down(paths):
+    placed = load(paths, columns=["status"], filters=[("status", "==", "Placed")])
+    assert len(placed) == 148
+    assert set(placed["status"]) == {"Placed"}
+
+    cohort = load(paths, filters=[("specialisation", "==", "Mkt&Fin"), ("workex", "==", "Yes")])
+    assert len(cohort) > 0
+    assert set(cohort["specialisation"]) == {"Mkt&Fin"} and set(cohort["workex"]) == {"Yes"}
+
+
+def test_parquet_is_rebuilt_when_csv_is_newer(paths):
+    csv_path, parquet_path = paths
+    assert len(load(paths)) == 215
+
+    extra = pd.read_csv(csv_path).tail(5)
+    extra.to_csv(csv_path, mode="a", header=False, index=False)
+    stamp = os.path.getmtime(parquet_path) + 10
+    os.utime(csv_path, (stamp, stamp))
+    assert len(load(paths)) == 220
+
+
+def test_parquet_is_reused_when_csv_is_older(paths):
+    csv_path, parquet_path = paths
+    load(paths)
+    before = os.stat(parquet_path).st_mtime_ns
+    load(paths)
+    assert os.stat(parquet_path).st_mtime_ns == before
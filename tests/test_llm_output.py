@@ -0,0 +1,126 @@
+import json
+
+import pytest
+
+from llm_output import MCQStream, _match_answer, parse_json, parse_mcq_payload, repair_json
+
+OPTIONS = ["Queue", "Stack", "Heap", "Go"]
+
+
+def question(answer="Stack", text="Which structure is LIFO?"):
+    return {"question": text, "options": OPTIONS, "correct_answer": answer, "explanation": "Last in, first out."}
+
+
+def payload(*questions):
+    return json.dumps({"questions": list(questions)})
+
+
+# ---------------- repair_json ----------------
+@pytest.mark.parametrize("raw, expected", [
+    ('```json\n{"a": 1}\n```', {"a": 1}),
+    ('Sure! Here is the test: {"a": 1} Hope this helps.', {"a": 1}),
+    ('{"a": [1, 2,],}', {"a": [1, 2]}),
+    ('{"a": True, "b": None}', {"a": True, "b": None}),
+    ('{"a": "line one\nline two"}', {"a": "line one\nline two"}),
+    ('{"q": "He said “hi”",}', {"q": "He said “hi”"}),
+    ('{“q”: “x”}', {"q": "x"}),
+    ('{"a": "x"} trailing {junk}', {"a": "x"}),
+    ('{"q":"a"}\n\nNote: {x}', {"q": "a"}),
+    ("{'q': 'x'}", {"q": "x"}),
+    ("{'q': 'It's fine', 'r': 'say \"hi\"'}", {"q": "It's fine", "r": 'say "hi"'}),
+    ("{'q': 'don\\'t'}", {"q": "don't"}),
+    ('{"a": {"b": "trunc', {"a": {"b": "trunc"}}),
+    ('{"a": [1, 2', {"a": [1, 2]}),
+    ('{"a": ', {"a": None}),
+    ('Here are [3] questions:\n{"a": [1]}', {"a": [1]}),
+    ('{"a": "ñ", "b": True}', {"a": "ñ", "b": True}),
+])
+def test_repair_json(raw, expected):
+    assert json.loads(repair_json(raw)) == expected
+
+
+def test_parse_json_leaves_valid_json_alone():
+    assert parse_json('{"a": "```"}') == {"a": "```"}
+
+
+@pytest.mark.parametrize("raw", ["no json here", "Désolé, je ne peux pas", '{"a": 1, ñ: 2}'])
+def test_parse_json_raises_value_error_when_unrecoverable(raw):
+    with pytest.raises(ValueError):
+        parse_json(raw)
+
+
+# ---------------- _match_answer ----------------
+@pytest.mark.parametrize("answer, expected", [
+    ("Stack", "Stack"),
+    (" stack ", "Stack"),
+    ("B", "Stack"),
+    ("b)", "Stack"),
+    ("Option D", "Go"),
+    ("c. Heap", "Heap"),
+    ("b) Heap", None),
+    ("Stack (LIFO)", "Stack"),
+    ("C is compiled", None),
+    ("A queue or a stack", None),
+    ("E", None),
+])
+def test_match_answer(answer, expected):
+    assert _match_answer(answer, OPTIONS) == expected
+
+
+def test_match_answer_rejects_partial_options():
+    assert _match_answer("10", ["100", "200", "300", "400"]) is None
+    assert _match_answer("True", ["True and False", "Only False", "Neither", "Both"]) is None
+
+
+def test_parse_mcq_payload_splits_valid_and_invalid():
+    valid, invalid = parse_mcq_payload(payload(question("B"), question("Rust")))
+    assert [q["correct_answer"] for q in valid] == ["Stack"]
+    assert invalid[0][1] == ["correct_answer is not one of the options"]
+
+
+# ---------------- MCQStream ----------------
+def stream(text, size):
+    parser = MCQStream()
+    fresh = []
+    for i in range(0, len(text), size):
+        fresh += parser.feed(text[i:i + size])
+    return parser, fresh
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 1000])
+def test_stream_yields_questions_across_chunk_boundaries(size):
+    tricky = question(text='What does "{[" print? Use \\"escapes\\" and \\\\ too}')
+    text = "Here's your test:\n```json\n" + payload(question(), tricky) + "\n```\nGood luck {!}"
+    parser, fresh = stream(text, size)
+    assert fresh == [question(), tricky] == parser.valid
+    assert parser.finish() == ([question(), tricky], [])
+
+
+@pytest.mark.parametrize("size", [1, 4, 1000])
+def test_stream_handles_single_quoted_strings(size):
+    text = "{'questions': [{'question': 'What's LIFO? {x}', 'options': ['Queue', 'Stack', 'Heap', 'Go'], " \
+           "'correct_answer': 'Stack', 'explanation': 'It's a stack.'}]}"
+    parser, fresh = stream(text, size)
+    assert [q["question"] for q in fresh] == ["What's LIFO? {x}"]
+
+
+@pytest.mark.parametrize("size", [1, 5, 1000])
+def test_stream_skips_brackets_in_leading_chatter(size):
+    text = "Here are [3] questions {for you}:\n" + payload(question(), question(), question())
+    parser, fresh = stream(text, size)
+    assert len(fresh) == 3
+    assert parser.finish() == ([question()] * 3, [])
+
+
+def test_stream_reports_invalid_and_truncated_items():
+    text = payload(question(), question("Rust"), question())[:-40]
+    parser, fresh = stream(text, 5)
+    valid, invalid = parser.finish()
+    assert fresh == valid == [question()]
+    assert len(invalid) == 1
+
+
+def test_finish_falls_back_to_whole_reply_parse():
+    parser = MCQStream()
+    parser.feed(json.dumps(question()))
+    assert parser.finish() == ([question()], [])
@@ -0,0 +1,20 @@
+import model_store
+
+
+def test_load_model_reloads_after_save(tmp_path):
+    path = str(tmp_path / "model.pkl")
+    model_store.save_model({"version": 1}, path)
+    first = model_store.load_model(path)
+    assert first == {"version": 1}
+    # Unchanged file: the cached object is served
+    assert model_store.load_model(path) is first
+
+    model_store.save_model({"version": 2}, path)
+    assert model_store.load_model(path) == {"version": 2}
+
+
+def test_default_path_is_resolved_at_call_time(tmp_path, monkeypatch):
+    monkeypatch.setattr(model_store, "MODEL_PATH", str(tmp_path / "live.pkl"))
+    model_store.save_model("live")
+    assert (tmp_path / "live.pkl").exists()
+    assert model_store.load_model() == "live"
@@ -0,0 +1,173 @@
+import functools
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import campus_data
+import model_store
+import retrain
+
+CAMPUS = campus_data.read_campus_csv(campus_data.CAMPUS_CSV)
+FAST_MODELS = retrain.candidate_models
+
+
+def outcomes(n, seed):
+    rows = CAMPUS.sample(n, random_state=seed, replace=True).reset_index(drop=True)
+    return rows.assign(skill_match=50.0)
+
+
+def snapshot():
+    return pd.read_parquet(retrain.SNAPSHOT_PATH)
+
+
+def meta():
+    with open(retrain.META_PATH) as f:
+        return json.load(f)
+
+
+@pytest.fixture(autouse=True)
+def store(tmp_path, monkeypatch):
+    data_dir = tmp_path / "data"
+    monkeypatch.setattr(retrain, "DATA_DIR", str(data_dir))
+    monkeypatch.setattr(retrain, "OUTCOMES_DIR", str(data_dir / "outcomes"))
+    monkeypatch.setattr(retrain, "SNAPSHOT_PATH", str(data_dir / "train_snapshot.parquet"))
+    monkeypatch.setattr(retrain, "META_PATH", str(data_dir / "model_meta.json"))
+    monkeypatch.setattr(model_store, "MODEL_PATH", str(tmp_path / "placement_model.pkl"))
+    monkeypatch.setattr(retrain, "load_campus", functools.partial(
+        campus_data.load_campus, parquet_path=str(tmp_path / "campus.parquet")))
+    # One candidate keeps the suite fast; selection between several is not under test
+    monkeypatch.setattr(retrain, "candidate_models", lambda: {"Logistic": FAST_MODELS()["Logistic"]})
+    return tmp_path
+
+
+class LiveModel:
+    """Stand-in for the serving model, scored through a patched _accuracy."""
+
+    def predict(self, X):
+        raise ValueError("Input X contains NaN.")
+
+
+def patch_scores(monkeypatch, candidate, live):
+    monkeypatch.setattr(retrain, "load_model", lambda: LiveModel())
+    monkeypatch.setattr(retrain, "_accuracy", lambda m, d: live if isinstance(m, LiveModel) else candidate)
+
+
+# ---------------- drift ----------------
+def test_population_stability_separates_same_and_shifted_data():
+    rng = np.random.default_rng(0)
+    base = pd.Series(rng.normal(7, 1, 500))
+    assert retrain.population_stability(base, pd.Series(rng.normal(7, 1, 100))) < retrain.PSI_THRESHOLD
+    assert retrain.population_stability(base, pd.Series(rng.normal(8.5, 1, 100))) > retrain.PSI_THRESHOLD
+
+
+def test_population_stability_compares_discrete_values():
+    base = pd.Series([0, 1] * 100)
+    assert retrain.population_stability(base, pd.Series([0, 1] * 30)) == pytest.approx(0)
+    assert retrain.population_stability(base, pd.Series([1] * 60)) > retrain.PSI_THRESHOLD
+
+
+def test_population_stability_ignores_missing_values():
+    assert retrain.population_stability(pd.Series([np.nan] * 10), pd.Series([1.0, 2.0])) == 0.0
+
+
+def features(n, seed, shift=0.0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "cgpa": rng.normal(7 + shift, 1, n), "internship": rng.integers(0, 2, n),
+        "communication": rng.normal(7, 1, n), "skill_match": np.nan, "placed": rng.integers(0, 2, n),
+    })
+
+
+@pytest.mark.parametrize("new_rows, shift, expected", [
+    (100, 0.0, True),   # new-data ratio: 100 >= 25% of 400
+    (20, 3.0, False),   # too few rows to judge drift
+    (60, 3.0, True),    # drift in cgpa
+    (60, 0.0, False),   # same distribution
+])
+def test_should_retrain_thresholds(new_rows, shift, expected):
+    retrain_now, reason, _ = retrain.should_retrain(features(400, 0), features(new_rows, 1, shift))
+    assert retrain_now is expected, reason
+
+
+# ---------------- retrain ----------------
+def test_first_retrain_commits_model_snapshot_and_meta():
+    part = retrain.record_outcomes(outcomes(60, 1))
+    assert retrain.retrain() is True
+
+    counts = snapshot()[retrain.SOURCE].value_counts().to_dict()
+    assert counts == {retrain.BASE_SOURCE: len(CAMPUS), part.rsplit("/", 1)[-1]: 60}
+    assert meta()["rows"] == len(CAMPUS) + 60
+    assert model_store.load_model() is not None
+    # Nothing new since: no retrain
+    assert retrain.retrain() is False
+
+
+def test_rejected_parts_wait_for_fresh_outcomes(monkeypatch):
+    first = retrain.record_outcomes(outcomes(60, 1)).rsplit("/", 1)[-1]
+    patch_scores(monkeypatch, candidate=0.5, live=0.9)
+    assert retrain.retrain() is False
+    assert meta()["rejected_parts"] == [first]
+
+    # The same parts alone don't trigger (and get rejected) again
+    monkeypatch.setattr(retrain, "train_best", lambda *a: pytest.fail("retrained on rejected parts"))
+    assert retrain.retrain() is False
+
+
+def test_rejected_parts_are_trained_on_with_fresh_outcomes(monkeypatch):
+    first = retrain.record_outcomes(outcomes(60, 1)).rsplit("/", 1)[-1]
+    with monkeypatch.context() as m:
+        patch_scores(m, candidate=0.5, live=0.9)
+        assert retrain.retrain() is False
+
+    second = retrain.record_outcomes(outcomes(60, 2)).rsplit("/", 1)[-1]
+    assert retrain.retrain() is True
+    assert set(snapshot()[retrain.SOURCE]) == {retrain.BASE_SOURCE, first, second}
+    assert meta()["rejected_parts"] == []
+
+
+def test_unscorable_live_model_blocks_swap_unless_forced(monkeypatch):
+    retrain.record_outcomes(outcomes(60, 1))
+    model_store.save_model(LiveModel())
+    monkeypatch.setattr(retrain, "load_model", lambda: LiveModel())
+
+    assert retrain.retrain() is False
+    assert isinstance(model_store.load_model(), LiveModel)
+
+    assert retrain.retrain(force=True) is True
+    assert not isinstance(model_store.load_model(), LiveModel)
+    assert meta()["live_error"] == "Input X contains NaN."
+
+
+def test_crash_before_snapshot_does_not_append_parts_twice(monkeypatch):
+    part = retrain.record_outcomes(outcomes(60, 1)).rsplit("/", 1)[-1]
+    write = retrain.atomic_write
+
+    def crash_on_snapshot(path, fn):
+        if path == retrain.SNAPSHOT_PATH:
+            raise RuntimeError("crash")
+        return write(path, fn)
+
+    with monkeypatch.context() as m:
+        m.setattr(retrain, "atomic_write", crash_on_snapshot)
+        with pytest.raises(RuntimeError):
+            retrain.retrain()
+
+    # The live model already saw these rows; let the rerun's comparison tie
+    with monkeypatch.context() as m:
+        patch_scores(m, candidate=0.8, live=0.8)
+        assert retrain.retrain() is True
+    assert snapshot()[retrain.SOURCE].value_counts()[part] == 60
+    assert len(snapshot()) == len(CAMPUS) + 60
+
+
+def test_full_rebuild_keeps_recorded_outcomes_in_snapshot():
+    part = retrain.record_outcomes(outcomes(60, 1)).rsplit("/", 1)[-1]
+    data = retrain.load_training_data()
+    model = retrain.candidate_models()["Logistic"].fit(data[retrain.FEATURES], data[retrain.TARGET])
+    retrain.commit_model(model, data, {"reason": "full rebuild"})
+
+    assert set(snapshot()[retrain.SOURCE]) == {retrain.BASE_SOURCE, part}
+    assert meta()["reason"] == "full rebuild"
+    assert retrain.retrain() is False
@@ -0,0 +1,56 @@
+import os
+import stat
+
+import pytest
+
+from storage import atomic_write
+
+
+def mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def write_text(text):
+    def write(tmp_path):
+        with open(tmp_path, "w") as f:
+            f.write(text)
+    return write
+
+
+def test_atomic_write_replaces_contents_and_leaves_no_temp_files(tmp_path):
+    path = str(tmp_path / "file.txt")
+    atomic_write(path, write_text("one"))
+    atomic_write(path, write_text("two"))
+    assert open(path).read() == "two"
+    assert os.listdir(tmp_path) == ["file.txt"]
+
+
+def test_atomic_write_keeps_old_file_when_write_fails(tmp_path):
+    path = str(tmp_path / "file.txt")
+    atomic_write(path, write_text("one"))
+
+    def fail(tmp_path):
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        atomic_write(path, fail)
+    assert open(path).read() == "one"
+    assert os.listdir(tmp_path) == ["file.txt"]
+
+
+def test_atomic_write_keeps_existing_mode(tmp_path):
+    path = str(tmp_path / "model.pkl")
+    atomic_write(path, write_text("one"))
+    os.chmod(path, 0o664)
+    atomic_write(path, write_text("two"))
+    assert mode(path) == 0o664
+
+
+def test_atomic_write_new_file_is_not_private(tmp_path):
+    old_umask = os.umask(0o022)
+    try:
+        path = str(tmp_path / "new.parquet")
+        atomic_write(path, write_text("x"))
+    finally:
+        os.umask(old_umask)
+    assert mode(path) == 0o644